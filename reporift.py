@@ -19,6 +19,27 @@ import re
 import json
 from pathlib import Path
 import shlex
+import sqlite3
+import stat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+def read_file_trigrams(path, max_size):
+    """
+    Return the set of lowercased trigrams in a text file, or None for files that are
+    missing, larger than max_size or binary. Kept at module level so the code-search
+    index can run it in worker processes.
+    """
+    try:
+        if os.path.getsize(path) > max_size:
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if b'\0' in data[:8192]:
+        return None
+    text = data.decode('utf-8', errors='ignore').lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 class RepoRift:
     """
@@ -29,12 +50,17 @@ class RepoRift:
     - Export (clone) repositories in bulk or individually
     - Push local files or directories to a remote GitHub repo
     - Search/filter repositories
+    - Track the local state of exported repositories
+    - Search code across exported repositories
     """
 
     def __init__(self):
         self.github_client = None
         self.user = None
         self.token_file = os.path.join(str(Path.home()), '.reprrift_token')
+        self.local_index_file = os.path.join(str(Path.home()), '.reporift_local_index.json')
+        self.search_index_file = os.path.join(str(Path.home()), '.reporift_search.db')
+        self.search_max_file_size = 1024 * 1024
         self.github_username = None
         self.github_token = None
         if self.load_saved_token():
@@ -230,10 +256,12 @@ class RepoRift:
                 try:
                     Repo.clone_from(url_git, dest)
                     print(f"Cloned: {dest}")
-                    input("Press Enter to continue...")
                 except Exception as e:
                     print(f"Clone failed: {e}")
                     input("Press Enter to continue...")
+                    return
+                self.refresh_search_index(self.scan_local_repositories(extra_checkouts=[dest]), paths=[dest])
+                input("Press Enter to continue...")
                 return
 
     def main_menu(self):
@@ -270,15 +298,23 @@ class RepoRift:
 
     def repository_list_menu(self):
         repos = list(self.user.get_repos())
+        local_repos = self.scan_local_repositories()
         filter_term = ""
         while True:
             self.clear_screen()
             self.print_header()
             filtered = [r for r in repos if filter_term.lower() in r.name.lower()]
+            local_by_remote = {}
+            for entry in local_repos.values():
+                if entry.get('remote'):
+                    local_by_remote.setdefault(entry['remote'], entry)
             print("\nYour repositories:")
             for i, repo in enumerate(filtered, 1):
-                print(f"{i}. {repo.name}{' (private)' if repo.private else ''}")
-            print("\nCommands: search <term>, numbers (e.g. 1,3-5) to export, merge <repo_number>, B to go back")
+                local = (local_by_remote.get(self.normalize_remote_url(repo.clone_url))
+                         or local_by_remote.get(self.normalize_remote_url(repo.ssh_url)))
+                local_status = f"  {self.format_local_status(local)}" if local else ''
+                print(f"{i}. {repo.name}{' (private)' if repo.private else ''}{local_status}")
+            print("\nCommands: search <term>, numbers (e.g. 1,3-5) to export, merge <repo_number>, refresh, grep [-i] <text>, find [-i] <text>, B to go back")
             selection = input().strip()
             # If filter is active and user presses enter on blank, reset filter
             if not selection:
@@ -291,6 +327,13 @@ class RepoRift:
                 parts = selection.split(' ', 1)
                 filter_term = parts[1] if len(parts) > 1 else ""
                 continue
+            if selection.lower() == 'refresh':
+                print("Rescanning local repositories...")
+                local_repos = self.scan_local_repositories(force=True)
+                continue
+            if selection.lower().split(' ', 1)[0] in ('grep', 'find'):
+                self.code_search_command(selection)
+                continue
             if selection.lower().startswith('merge'):
                 parts = selection.split()
                 if len(parts) == 2 and parts[1].isdigit():
@@ -349,6 +392,7 @@ class RepoRift:
                 if not dest_dir:
                     print("Export cancelled."); time.sleep(1); continue
                 print("cloning:")
+                cloned = []
                 for num in sorted(set(sels)):
                     idx = num - 1
                     if 0 <= idx < len(filtered):
@@ -359,10 +403,14 @@ class RepoRift:
                         else:
                             try:
                                 Repo.clone_from(repo.clone_url, repo_dir)
+                                cloned.append(repo_dir)
                                 status = 'cloned'
                             except Exception as e:
                                 status = f'failed ({e})'
                         print(f"{repo.name}   {status}")
+                local_repos = self.scan_local_repositories(extra_checkouts=cloned)
+                if cloned:
+                    self.refresh_search_index(local_repos, paths=cloned)
                 print()
                 if dest_dir == os.path.join(os.getcwd(), "repositories"):
                     print(f"Cloning complete. saved in: {dest_dir}")
@@ -467,12 +515,503 @@ class RepoRift:
                 try:
                     Repo.clone_from(repo.clone_url,dest_dir)
                     print("Clone complete.")
-                    if not summary_mode: input("Press Enter to continue...")
                 except Exception as e:
                     print(f"Clone failed: {e}")
                     if not summary_mode: input("Press Enter to continue...")
+                    return dest_dir
+                self.refresh_search_index(self.scan_local_repositories(extra_checkouts=[dest_dir]), paths=[dest_dir])
+                if not summary_mode: input("Press Enter to continue...")
             return dest_dir
 
+    def load_local_index(self):
+        try:
+            with open(self.local_index_file, 'r') as f:
+                index = json.load(f)
+            if isinstance(index, dict):
+                index.setdefault('checkouts', [])
+                index.setdefault('repos', {})
+                return index
+        except Exception:
+            pass
+        return {'checkouts': [], 'repos': {}}
+
+    def save_local_index(self, index):
+        try:
+            tmp_file = self.local_index_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp_file, self.local_index_file)
+            return True
+        except Exception:
+            return False
+
+    def local_repository_signature(self, path):
+        """
+        Cheap change marker for a checkout: the mtimes of the checkout directory and
+        of the git metadata that moves on commit, checkout, fetch, push and staging.
+        Refs live in nested directories (refs/remotes/origin, refs/heads/feature), so
+        every directory under refs/heads and refs/remotes is included.
+        """
+        git_dir = os.path.join(path, '.git')
+        markers = [path, git_dir, os.path.join(git_dir, 'HEAD'), os.path.join(git_dir, 'index'),
+                   os.path.join(git_dir, 'FETCH_HEAD'), os.path.join(git_dir, 'packed-refs'),
+                   os.path.join(git_dir, 'logs', 'HEAD')]
+        for refs in (os.path.join(git_dir, 'refs', 'heads'), os.path.join(git_dir, 'refs', 'remotes')):
+            for current, dirs, _ in os.walk(refs):
+                dirs.sort()
+                markers.append(current)
+        signature = []
+        for marker in markers:
+            try:
+                signature.append(os.stat(marker).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return signature
+
+    def directory_size(self, path):
+        total = 0
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            else:
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return total
+
+    def inspect_local_repository(self, path, previous=None):
+        """
+        Collect HEAD, branch, dirty state, ahead/behind and disk usage for one checkout.
+        Ahead/behind is measured against the upstream branch as of the last fetch.
+        git status always runs; the slower disk usage walk and the remote lookup are
+        reused from previous when the signature has not changed.
+        """
+        entry = {
+            'name': os.path.basename(path),
+            'path': path,
+            'signature': self.local_repository_signature(path),
+            'head': None,
+            'branch': None,
+            'upstream': None,
+            'remote': None,
+            'dirty': False,
+            'ahead': 0,
+            'behind': 0,
+            'size': 0,
+            'error': None,
+        }
+        try:
+            # --no-optional-locks keeps status from rewriting .git/index, which would
+            # otherwise change the signature and force a rescan next time.
+            result = subprocess.run(
+                ['git', '--no-optional-locks', '-C', path, 'status', '--porcelain=v2', '--branch'],
+                capture_output=True, text=True, timeout=120
+            )
+            if result.returncode != 0:
+                entry['error'] = result.stderr.strip() or 'git status failed'
+            for line in result.stdout.splitlines():
+                if line.startswith('# branch.oid '):
+                    oid = line.split(' ', 2)[2]
+                    entry['head'] = None if oid == '(initial)' else oid
+                elif line.startswith('# branch.head '):
+                    head = line.split(' ', 2)[2]
+                    entry['branch'] = None if head == '(detached)' else head
+                elif line.startswith('# branch.upstream '):
+                    entry['upstream'] = line.split(' ', 2)[2]
+                elif line.startswith('# branch.ab '):
+                    ahead, behind = line.split(' ')[2:4]
+                    entry['ahead'] = int(ahead.lstrip('+'))
+                    entry['behind'] = int(behind.lstrip('-'))
+                elif line and not line.startswith('#'):
+                    entry['dirty'] = True
+        except Exception as e:
+            entry['error'] = str(e)
+        if previous and previous.get('signature') == entry['signature'] and 'remote' in previous:
+            entry['remote'] = previous['remote']
+            entry['size'] = previous['size']
+            return entry
+        try:
+            remote = subprocess.run(['git', '-C', path, 'config', '--get', 'remote.origin.url'],
+                                    capture_output=True, text=True, timeout=30)
+            entry['remote'] = self.normalize_remote_url(remote.stdout.strip()) if remote.returncode == 0 else None
+        except Exception:
+            pass
+        entry['size'] = self.directory_size(path)
+        return entry
+
+    def normalize_remote_url(self, url):
+        """
+        Reduce a remote URL to 'host/owner/name' so HTTPS, token and SSH forms of the
+        same repository compare equal.
+        """
+        if not url:
+            return None
+        url = url.strip().rstrip('/')
+        if url.endswith('.git'):
+            url = url[:-4]
+        match = re.match(r'^[\w.-]+@([^:/]+):(.+)$', url)
+        if match:
+            return f"{match.group(1)}/{match.group(2)}".lower()
+        url = re.sub(r'^[a-z+]+://', '', url)
+        url = url.split('@', 1)[-1]
+        return url.lower()
+
+    def list_local_checkouts(self, index=None, extra_checkouts=None):
+        """
+        Return (checkouts, recorded): every git checkout in the local repositories
+        folder plus the recorded exports elsewhere, and the recorded exports alone.
+        """
+        if index is None:
+            index = self.load_local_index()
+        root = os.path.abspath(os.path.join(os.getcwd(), "repositories"))
+        try:
+            with os.scandir(root) as entries:
+                checkouts = sorted(e.path for e in entries if e.is_dir())
+        except OSError:
+            checkouts = []
+        recorded = []
+        for path in index['checkouts'] + (extra_checkouts or []):
+            path = os.path.abspath(path)
+            if path not in recorded and os.path.isdir(path):
+                recorded.append(path)
+        paths = []
+        for path in checkouts + recorded:
+            if path not in paths and os.path.exists(os.path.join(path, '.git')):
+                paths.append(path)
+        return paths, recorded
+
+    def display_checkout_path(self, repo_path):
+        root = os.path.abspath(os.path.join(os.getcwd(), "repositories"))
+        if os.path.dirname(repo_path) == root:
+            return os.path.basename(repo_path)
+        home = str(Path.home())
+        if repo_path.startswith(home + os.sep):
+            return '~' + repo_path[len(home):]
+        return repo_path
+
+    def scan_local_repositories(self, extra_checkouts=None, force=False):
+        """
+        Refresh the persisted index of exported checkouts and return it keyed by path.
+        Covers every checkout in the local repositories folder plus the checkouts
+        RepoRift cloned elsewhere, all inspected in parallel. Unless force is set,
+        disk usage is only measured again for checkouts whose signature changed.
+        """
+        index = self.load_local_index()
+        paths, recorded = self.list_local_checkouts(index, extra_checkouts)
+        previous = [None if force else index['repos'].get(path) for path in paths]
+        repos = {}
+        if paths:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for entry in pool.map(self.inspect_local_repository, paths, previous):
+                    repos[entry['path']] = entry
+        self.save_local_index({'checkouts': recorded, 'repos': repos})
+        return repos
+
+    def format_size(self, size):
+        for unit in ('B', 'KB', 'MB', 'GB'):
+            if size < 1024 or unit == 'GB':
+                return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+            size /= 1024
+
+    def format_local_status(self, entry):
+        if entry.get('error'):
+            return "[local: unreadable]"
+        head = entry['head'][:7] if entry['head'] else '(no commits)'
+        parts = [f"{entry['branch'] or 'detached'}@{head}"]
+        if entry['dirty']:
+            parts.append('dirty')
+        if entry['ahead'] or entry['behind']:
+            parts.append(f"ahead {entry['ahead']}, behind {entry['behind']}")
+        parts.append(self.format_size(entry['size']))
+        return f"[local: {', '.join(parts)}]"
+
+    def open_search_index(self):
+        conn = sqlite3.connect(self.search_index_file, timeout=5)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != 2:
+            # Older layouts kept no per-file stat data; start the index over.
+            conn.executescript("DROP TABLE IF EXISTS trigrams; DROP TABLE IF EXISTS files; "
+                               "DROP TABLE IF EXISTS repos; PRAGMA user_version = 2;")
+        conn.execute("CREATE TABLE IF NOT EXISTS repos (path TEXT PRIMARY KEY, head TEXT, dirty TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, repo TEXT, path TEXT, mtime INTEGER, size INTEGER, UNIQUE (repo, path))")
+        conn.execute("CREATE TABLE IF NOT EXISTS trigrams (trigram TEXT, file_id INTEGER, PRIMARY KEY (trigram, file_id)) WITHOUT ROWID")
+        conn.execute("CREATE INDEX IF NOT EXISTS trigrams_file ON trigrams (file_id)")
+        return conn
+
+    def git_paths(self, repo_path, *args):
+        """
+        Run a git command that prints NUL-separated paths and return them as a set,
+        or None if git fails.
+        """
+        try:
+            result = subprocess.run(['git', '--no-optional-locks', '-C', repo_path] + list(args) + ['-z'],
+                                    capture_output=True, timeout=300)
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        return {p for p in result.stdout.decode('utf-8', errors='replace').split('\0') if p}
+
+    def git_working_tree_changes(self, repo_path):
+        """
+        Return (HEAD, paths) for a checkout, where paths are the files that differ from
+        HEAD in the index or working tree plus untracked files that are not ignored.
+        Returns None if git fails.
+        """
+        try:
+            result = subprocess.run(
+                ['git', '--no-optional-locks', '-C', repo_path, 'status', '--porcelain=v2', '--branch',
+                 '--no-renames', '--untracked-files=all', '-z'],
+                capture_output=True, timeout=300
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        head = None
+        paths = set()
+        for record in result.stdout.decode('utf-8', errors='replace').split('\0'):
+            if record.startswith('# branch.oid '):
+                oid = record.split(' ', 2)[2]
+                head = None if oid == '(initial)' else oid
+            elif record.startswith('1 '):
+                paths.add(record.split(' ', 8)[8])
+            elif record.startswith('u '):
+                paths.add(record.split(' ', 10)[10])
+            elif record.startswith('? '):
+                paths.add(record[2:])
+        return head, paths
+
+    def remove_indexed_files(self, conn, repo_path, paths=None):
+        if paths is None:
+            ids = [row[0] for row in conn.execute("SELECT id FROM files WHERE repo = ?", (repo_path,))]
+        else:
+            ids = []
+            for path in paths:
+                row = conn.execute("SELECT id FROM files WHERE repo = ? AND path = ?", (repo_path, path)).fetchone()
+                if row:
+                    ids.append(row[0])
+        conn.executemany("DELETE FROM trigrams WHERE file_id = ?", [(i,) for i in ids])
+        conn.executemany("DELETE FROM files WHERE id = ?", [(i,) for i in ids])
+
+    def update_search_index(self, local_repos, paths=None):
+        """
+        Bring the code-search index in line with the exported checkouts (any collection
+        of checkout paths, such as the dict from scan_local_repositories), or only with
+        the checkouts in paths. Every checkout is asked for its HEAD and working tree
+        changes; files are re-read only if git lists them as changed (commits since the
+        indexed HEAD, working tree edits, untracked files) and their size or mtime moved.
+        A checkout seen for the first time is listed in full. Work is committed per
+        batch of files, so an interrupted build keeps what it finished.
+        """
+        conn = self.open_search_index()
+        pool = None
+        try:
+            indexed = {row[0]: (row[1], json.loads(row[2])) for row in conn.execute("SELECT path, head, dirty FROM repos")}
+            if paths is None:
+                targets = list(local_repos)
+                for repo_path in set(indexed) - set(local_repos):
+                    self.remove_indexed_files(conn, repo_path)
+                    conn.execute("DELETE FROM repos WHERE path = ?", (repo_path,))
+                conn.commit()
+            else:
+                targets = [p for p in (os.path.abspath(p) for p in paths) if p in local_repos]
+            if not targets:
+                return 0
+            workers = min(32, (os.cpu_count() or 1) * 4, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as probe_pool:
+                probes = list(probe_pool.map(self.git_working_tree_changes, targets))
+            updated = 0
+            for repo_path, probe in zip(targets, probes):
+                if probe is None:
+                    continue
+                head, dirty = probe
+                old_head, old_dirty = indexed.get(repo_path, (None, None))
+                candidates = None
+                if old_dirty is not None and old_head == head:
+                    candidates = dirty | set(old_dirty)
+                elif old_dirty is not None and old_head and head:
+                    changed = self.git_paths(repo_path, 'diff', '--name-only', '--no-renames', old_head, head)
+                    if changed is not None:
+                        candidates = changed | dirty | set(old_dirty)
+                if candidates is None:
+                    listed = self.git_paths(repo_path, 'ls-files', '--cached', '--others', '--exclude-standard')
+                    if listed is None:
+                        continue
+                    known = {row[0] for row in conn.execute("SELECT path FROM files WHERE repo = ?", (repo_path,))}
+                    self.remove_indexed_files(conn, repo_path, known - listed)
+                    candidates = listed
+                if pool is None and len(candidates) >= 64:
+                    pool = ProcessPoolExecutor()
+                updated += self.index_repository_files(conn, repo_path, candidates, pool)
+                if (old_head, old_dirty) != (head, sorted(dirty)):
+                    conn.execute("INSERT OR REPLACE INTO repos (path, head, dirty) VALUES (?, ?, ?)",
+                                 (repo_path, head, json.dumps(sorted(dirty))))
+                    conn.commit()
+            return updated
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            conn.close()
+
+    def index_repository_files(self, conn, repo_path, candidates, pool=None):
+        """
+        Re-index the candidate files of one checkout whose size or mtime differ from the
+        stored row, dropping rows for files that are gone. Every file gets a row so
+        'find' sees it; only text files within the size cap get trigrams. Files are
+        read in batches of bounded total size and each batch is committed.
+        """
+        pending = []
+        for path in sorted(candidates):
+            row = conn.execute("SELECT id, mtime, size FROM files WHERE repo = ? AND path = ?", (repo_path, path)).fetchone()
+            try:
+                info = os.lstat(os.path.join(repo_path, path))
+            except OSError:
+                info = None
+            if info is None or not stat.S_ISREG(info.st_mode):
+                if row:
+                    self.remove_indexed_files(conn, repo_path, [path])
+                continue
+            if row and row[1] == info.st_mtime_ns and row[2] == info.st_size:
+                continue
+            pending.append((path, row[0] if row else None, info.st_mtime_ns, info.st_size))
+        conn.commit()
+        start = 0
+        while start < len(pending):
+            end, batch_bytes = start, 0
+            while end < len(pending) and end - start < 1000 and batch_bytes < 64 * 1024 * 1024:
+                if pending[end][3] <= self.search_max_file_size:
+                    batch_bytes += pending[end][3]
+                end += 1
+            batch = pending[start:end]
+            full_paths = [os.path.join(repo_path, item[0]) for item in batch]
+            sizes = [self.search_max_file_size] * len(batch)
+            if pool is not None and len(batch) >= 64:
+                results = pool.map(read_file_trigrams, full_paths, sizes, chunksize=16)
+            else:
+                results = map(read_file_trigrams, full_paths, sizes)
+            for (path, file_id, mtime, size), trigrams in zip(batch, results):
+                if file_id is None:
+                    file_id = conn.execute("INSERT INTO files (repo, path, mtime, size) VALUES (?, ?, ?, ?)",
+                                           (repo_path, path, mtime, size)).lastrowid
+                else:
+                    conn.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+                    conn.execute("UPDATE files SET mtime = ?, size = ? WHERE id = ?", (mtime, size, file_id))
+                if trigrams:
+                    conn.executemany("INSERT INTO trigrams (trigram, file_id) VALUES (?, ?)", ((t, file_id) for t in trigrams))
+            conn.commit()
+            start = end
+        return len(pending)
+
+    def refresh_search_index(self, local_repos, paths=None):
+        print("Updating search index...")
+        try:
+            self.update_search_index(local_repos, paths)
+            return True
+        except KeyboardInterrupt:
+            print("Search index update interrupted. Files indexed so far are kept.")
+        except (sqlite3.Error, OSError) as e:
+            print(f"Search index update failed: {e}")
+        return False
+
+    def search_code(self, query, limit=200, ignore_case=False):
+        """
+        Return (repo, path, line number, line) matches for a literal query of at least
+        three characters. The rarest query trigrams drive an index lookup; each
+        candidate file is then read to confirm and locate the matching lines.
+        The index is case-insensitive, so ignore_case only changes that last check.
+        """
+        lowered = query.lower()
+        trigrams = {lowered[i:i + 3] for i in range(len(lowered) - 2)}
+        if not trigrams:
+            return []
+        matches = []
+        conn = self.open_search_index()
+        try:
+            # Counting is capped so a common trigram costs no more than a rare one.
+            counts = {t: conn.execute("SELECT COUNT(*) FROM (SELECT 1 FROM trigrams WHERE trigram = ? LIMIT 10000)",
+                                      (t,)).fetchone()[0] for t in trigrams}
+            if not all(counts.values()):
+                return []
+            rarest = sorted(trigrams, key=lambda t: (counts[t], t))[:8]
+            sql = ("SELECT f.repo, f.path FROM trigrams t JOIN files f ON f.id = t.file_id WHERE t.trigram = ?"
+                   + " AND EXISTS (SELECT 1 FROM trigrams WHERE trigram = ? AND file_id = t.file_id)" * (len(rarest) - 1))
+            for repo_path, path in conn.execute(sql, rarest):
+                try:
+                    with open(os.path.join(repo_path, path), 'r', encoding='utf-8', errors='ignore') as f:
+                        for number, line in enumerate(f, 1):
+                            if (lowered in line.lower()) if ignore_case else (query in line):
+                                matches.append((repo_path, path, number, line.rstrip('\n')))
+                                if len(matches) >= limit:
+                                    return matches
+                except OSError:
+                    continue
+        finally:
+            conn.close()
+        return matches
+
+    def find_indexed_files(self, term, limit=200, ignore_case=False):
+        conn = self.open_search_index()
+        try:
+            if ignore_case:
+                sql = "SELECT repo, path FROM files WHERE instr(lower(path), ?) > 0 ORDER BY repo, path LIMIT ?"
+                term = term.lower()
+            else:
+                sql = "SELECT repo, path FROM files WHERE instr(path, ?) > 0 ORDER BY repo, path LIMIT ?"
+            return conn.execute(sql, (term, limit)).fetchall()
+        finally:
+            conn.close()
+
+    def code_search_command(self, selection):
+        command, _, term = selection.partition(' ')
+        command = command.lower()
+        term = term.strip()
+        ignore_case = term == '-i' or term.startswith('-i ')
+        if ignore_case:
+            term = term[2:].strip()
+        if not term:
+            print(f"Usage: {command} [-i] <text>")
+            input("Press Enter to continue...")
+            return
+        if command == 'grep' and len(term) < 3:
+            print("Search text must be at least 3 characters.")
+            input("Press Enter to continue...")
+            return
+        limit = 200
+        started = time.perf_counter()
+        self.refresh_search_index(self.list_local_checkouts()[0])
+        searched = time.perf_counter()
+        try:
+            # Ask for one result more than shown to tell whether the list was cut off.
+            if command == 'grep':
+                results = self.search_code(term, limit=limit + 1, ignore_case=ignore_case)
+                lines = [f"{self.display_checkout_path(repo)}/{path}:{number}: {line.strip()[:200]}"
+                         for repo, path, number, line in results]
+            else:
+                results = self.find_indexed_files(term, limit=limit + 1, ignore_case=ignore_case)
+                lines = [f"{self.display_checkout_path(repo)}/{path}" for repo, path in results]
+        except (sqlite3.Error, OSError) as e:
+            print(f"Search failed: {e}")
+            input("Press Enter to continue...")
+            return
+        finished = time.perf_counter()
+        print()
+        for line in lines[:limit]:
+            print(line)
+        if len(lines) > limit:
+            print(f"\nResults truncated at {limit}.")
+        print(f"\n{min(len(lines), limit)} result(s) in {(finished - started) * 1000:.0f} ms "
+              f"(index update {(searched - started) * 1000:.0f} ms, search {(finished - searched) * 1000:.0f} ms)")
+        input("\nPress Enter to return...")
+
     def about_page(self):
         """
         Display the About page with summary, author, and documentation link.
@@ -672,13 +1211,16 @@ class RepoRift:
         self.print_header()
         print("\nHelp Menu")
         print("-"*40)
-        print("1. repositories: List and manage your GitHub repositories.")
+        print("1. repositories: List and manage your GitHub repositories, with the local state of exported copies.")
         print("2. Clone repository by URL: Clone any public or private repository using its URL.")
         print("3. About: Information about RepoRift.")
         print("4. Help: Show this help menu.")
         print("5. Logout: Log out of your GitHub account.")
         print("6. Exit: Quit the program.")
         print("\nIn repository menus, you can search, export, or merge files/folders into your repositories.")
+        print("Use 'refresh' to re-check the local state of exported repositories, including disk usage.")
+        print("Use 'grep <text>' to search code and 'find <text>' to search file paths across exported repositories.")
+        print("Both are case-sensitive; add -i (e.g. 'grep -i <text>') to ignore case.")
         print("Type 'b' to go back at any menu.")
         input("\nPress Enter to return to the main menu...")
         return